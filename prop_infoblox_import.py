@@ -28,10 +28,28 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import argparse
 import os
+import time
 from dotenv import load_dotenv
 import getpass
 import sys
 
+# orjson serializes straight to UTF-8 bytes several times faster than
+# the stdlib encoder (and parses faster too); WAPI payloads are plain
+# dicts and lists either library handles
+try:
+    import orjson
+
+    def _json_body(data) -> bytes:
+        return orjson.dumps(data)
+
+    def _json_loads(raw):
+        return orjson.loads(raw)
+except ImportError:
+    def _json_body(data) -> bytes:
+        return json.dumps(data).encode()
+
+    _json_loads = json.loads
+
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -40,7 +58,7 @@ ABS_LOG_FILE_PATH = os.path.abspath('prop_infoblox_import.log')
 
 # Configure logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Changed to DEBUG for better troubleshooting
+    level=logging.INFO,  # Use --debug for verbose troubleshooting output
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler(ABS_LOG_FILE_PATH),
@@ -136,7 +154,13 @@ Examples:
         '--network-view',
         help='InfoBlox network view to use (overrides config)'
     )
-    
+
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug logging (default: INFO level)'
+    )
+
     return parser.parse_args()
 
 
@@ -255,8 +279,8 @@ def show_and_edit_config():
                         logger.warning(f"Could not connect with new password: {e}")
                         
         elif choice == '5':
-            # Show available CSV files
-            csv_files = [f for f in os.listdir('.') if f.endswith('.csv')]
+            # Show available CSV files (os.scandir avoids extra stat calls)
+            csv_files = sorted(e.name for e in os.scandir('.') if e.is_file() and e.name.endswith('.csv'))
             if csv_files:
                 print("\nAvailable CSV files:")
                 for i, f in enumerate(csv_files, 1):
@@ -375,7 +399,10 @@ def get_config(skip_network_view_prompt: bool = False, config_override: Optional
 def main():
     """Main function with all enhanced features"""
     args = parse_arguments()
-    
+
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
     try:
         config_override = None
         
@@ -582,7 +609,16 @@ def main():
 
 class InfoBloxClient:
     """InfoBlox WAPI client for network management"""
-    
+
+    # EA definition cache shared across client instances, keyed by
+    # (grid_master, username) so interactive reconfiguration (which
+    # rebuilds the client) doesn't refetch unchanged definitions
+    _shared_ea_cache: Dict[Tuple[str, str], Dict] = {}
+
+    # Network views rarely change; cache them briefly so repeated menu
+    # actions don't each pay a WAPI round trip
+    _VIEWS_CACHE_TTL = 60.0
+
     def __init__(self, grid_master: str, username: str, password: str, api_version: str = "v2.13.1"):
         self.grid_master = grid_master
         self.username = username
@@ -592,19 +628,42 @@ class InfoBloxClient:
         self.session = requests.Session()
         self.session.auth = (username, password)
         self.session.verify = False
-        self._ea_cache = {}
+        # Widen the HTTPS connection pool: the comparison and creation
+        # loops issue many requests to the same grid master, and the
+        # default pool of 10 would close and re-handshake connections
+        # once callers (or threads) exceed it. The retry policy absorbs
+        # transient 429/5xx responses from a busy grid master with a
+        # short backoff instead of failing the whole import
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=50, pool_maxsize=50,
+            max_retries=urllib3.util.Retry(total=3, backoff_factor=0.3,
+                                           status_forcelist=[429, 502, 503, 504]))
+        self.session.mount('https://', adapter)
+        # Bodies are serialized by _json_body, so requests no longer
+        # sets the content type from a json= argument
+        self.session.headers['Content-Type'] = 'application/json'
+        self._ea_cache = self._shared_ea_cache.setdefault((grid_master, username), {})
+        self._views_cache = None  # (fetched_at, views)
+        self._url_cache = {}  # endpoint -> full WAPI URL
         
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> requests.Response:
         """Make HTTP request to InfoBlox WAPI"""
-        url = f"{self.base_url}/{endpoint}"
+        # The handful of endpoints repeat across thousands of calls, so
+        # format each URL once instead of per request
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = f"{self.base_url}/{endpoint}"
         
         try:
+            # Serializing here (orjson when available) avoids a second
+            # stdlib-json encode inside requests' json= handling
+            body = _json_body(data) if data is not None else None
             if method.upper() == 'GET':
                 response = self.session.get(url, params=params)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, params=params)
+                response = self.session.post(url, data=body, params=params)
             elif method.upper() == 'PUT':
-                response = self.session.put(url, json=data, params=params)
+                response = self.session.put(url, data=body, params=params)
             elif method.upper() == 'DELETE':
                 response = self.session.delete(url, params=params)
             else:
@@ -628,10 +687,16 @@ class InfoBloxClient:
             raise
     
     def get_network_views(self) -> List[Dict]:
-        """Get all network views from InfoBlox"""
+        """Get all network views from InfoBlox (cached for a short TTL)"""
+        if self._views_cache is not None:
+            fetched_at, views = self._views_cache
+            if time.time() - fetched_at < self._VIEWS_CACHE_TTL:
+                return views
+
         try:
             response = self._make_request('GET', 'networkview')
             views = response.json()
+            self._views_cache = (time.time(), views)
             return views
         except Exception as e:
             logger.error(f"Error fetching network views: {e}")
@@ -640,8 +705,8 @@ class InfoBloxClient:
     def get_csv_files(self) -> List[str]:
         """Get list of CSV files in current directory"""
         try:
-            csv_files = [f for f in os.listdir('.') if f.endswith('.csv')]
-            return sorted(csv_files)
+            # os.scandir caches file type info, avoiding a stat per entry
+            return sorted(e.name for e in os.scandir('.') if e.is_file() and e.name.endswith('.csv'))
         except Exception as e:
             logger.error(f"Error listing CSV files: {e}")
             return []
@@ -658,14 +723,14 @@ class InfoBloxClient:
             response = self._make_request('GET', 'network', params=params)
             networks = response.json()
             if networks:
-                logger.debug(f"Found network {cidr} in view {network_view}")
+                logger.debug("Found network %s in view %s", cidr, network_view)
                 return networks[0]
             else:
-                logger.debug(f"Network {cidr} not found in view {network_view}")
+                logger.debug("Network %s not found in view %s", cidr, network_view)
                 return None
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 400 or e.response.status_code == 404:
-                logger.debug(f"Network {cidr} not found in view {network_view} (HTTP {e.response.status_code})")
+                logger.debug("Network %s not found in view %s (HTTP %s)", cidr, network_view, e.response.status_code)
                 return None
             else:
                 logger.error(f"Error checking network {cidr}: HTTP {e.response.status_code}")
@@ -683,14 +748,14 @@ class InfoBloxClient:
             response = self._make_request('GET', 'networkcontainer', params=params)
             containers = response.json()
             if containers:
-                logger.debug(f"Found network container {cidr} in view {network_view}")
+                logger.debug("Found network container %s in view %s", cidr, network_view)
                 return containers[0]
             else:
-                logger.debug(f"Network container {cidr} not found in view {network_view}")
+                logger.debug("Network container %s not found in view %s", cidr, network_view)
                 return None
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 400 or e.response.status_code == 404:
-                logger.debug(f"Network container {cidr} not found in view {network_view} (HTTP {e.response.status_code})")
+                logger.debug("Network container %s not found in view %s (HTTP %s)", cidr, network_view, e.response.status_code)
                 return None
             else:
                 logger.error(f"Error checking network container {cidr}: HTTP {e.response.status_code}")
@@ -722,17 +787,18 @@ class InfoBloxClient:
             'object': None
         }
     
-    def create_network(self, cidr: str, network_view: str = "default", 
-                      comment: str = "", extattrs: Optional[Dict[str, str]] = None) -> Dict:
-        """Create a new network in InfoBlox"""
+    @staticmethod
+    def _network_payload(cidr: str, network_view: str = "default",
+                         comment: str = "", extattrs: Optional[Dict[str, str]] = None) -> Dict:
+        """Build the WAPI payload for a network create"""
         data = {
             'network': cidr,
             'network_view': network_view
         }
-        
+
         if comment:
             data['comment'] = comment
-            
+
         if extattrs:
             # Ensure all EA values are strings and not empty
             cleaned_extattrs = {}
@@ -741,9 +807,30 @@ class InfoBloxClient:
                     cleaned_extattrs[k] = str(v)
             if cleaned_extattrs:
                 data['extattrs'] = {k: {'value': v} for k, v in cleaned_extattrs.items()}
-        
+
+        return data
+
+    def bulk_request(self, ops: List[Dict]) -> List:
+        """
+        Execute multiple WAPI operations in a single POST to the request
+        endpoint. Each op is a dict like
+        {'method': 'POST', 'object': 'network', 'data': {...}}; the grid
+        returns one result per op. Note the grid executes the batch as a
+        unit, so a failing op fails the whole batch.
+        """
+        response = self._make_request('POST', 'request', data=ops)
+        # The batch response carries one result per op - the largest
+        # payload this client decodes - so parse it with the fast path
+        return _json_loads(response.content)
+
+    def create_network(self, cidr: str, network_view: str = "default",
+                      comment: str = "", extattrs: Optional[Dict[str, str]] = None) -> Dict:
+        """Create a new network in InfoBlox"""
+        data = self._network_payload(cidr, network_view, comment, extattrs)
+
         # Log the request data for debugging
-        logger.debug(f"Creating network with data: {json.dumps(data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating network with data: %s", json.dumps(data, indent=2))
         
         try:
             response = self._make_request('POST', 'network', data=data)
@@ -764,7 +851,8 @@ class InfoBloxClient:
             
             # Log full error details
             logger.error(f"Failed to create network {cidr}: {error_msg}")
-            logger.debug(f"Request data was: {json.dumps(data, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request data was: %s", json.dumps(data, indent=2))
             
             # Re-raise with more specific error message
             raise Exception(f"{error_msg}")
@@ -776,6 +864,15 @@ class InfoBloxClient:
             self._ea_cache['definitions'] = response.json()
         return self._ea_cache['definitions']
     
+    def get_extensible_attribute_names(self) -> frozenset:
+        """EA definition names, cached alongside the definitions so
+        repeated existence checks neither refetch nor rebuild the set"""
+        names = self._ea_cache.get('names')
+        if names is None:
+            names = self._ea_cache['names'] = frozenset(
+                ea['name'] for ea in self.get_extensible_attributes())
+        return names
+    
     def create_extensible_attribute(self, name: str, data_type: str = "STRING", 
                                   comment: str = "", default_value: str = "") -> Dict:
         """Create a new Extended Attribute definition in InfoBlox"""
@@ -791,8 +888,8 @@ class InfoBloxClient:
         try:
             response = self._make_request('POST', 'extensibleattributedef', data=data)
             logger.info(f"Created Extended Attribute definition: {name}")
-            if 'definitions' in self._ea_cache:
-                del self._ea_cache['definitions']
+            self._ea_cache.pop('definitions', None)
+            self._ea_cache.pop('names', None)
             return response.json()
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 400:
@@ -900,25 +997,36 @@ class PropertyManager:
         """Compare property networks with InfoBlox networks"""
         results = {
             'matches': [],
-            'missing': [], 
+            'missing': [],
             'discrepancies': [],
             'containers': [],
             'errors': []
         }
-        
+
+        # parse_prefixes can expand multiple property rows to the same CIDR;
+        # cache existence checks per CIDR so duplicates don't cost extra WAPI
+        # round trips while per-site reporting stays intact
+        existence_cache = {}
+        duplicate_count = 0
+
         for _, prop in property_df.iterrows():
             cidr = prop['cidr']
             site_id = prop['site_id']
             m_host = prop['m_host']
-            
+
             try:
                 mapped_eas = self.map_properties_to_infoblox_eas(site_id, m_host)
-                
-                # Check if network exists
-                existence_check = self.ib_client.check_network_or_container_exists(cidr, network_view)
+
+                # Check if network exists (reuse cached result for duplicate CIDRs)
+                if cidr in existence_cache:
+                    existence_check = existence_cache[cidr]
+                    duplicate_count += 1
+                else:
+                    existence_check = self.ib_client.check_network_or_container_exists(cidr, network_view)
+                    existence_cache[cidr] = existence_check
                 
                 if not existence_check['exists']:
-                    logger.debug(f"Network {cidr} (site_id: {site_id}) not found in InfoBlox")
+                    logger.debug("Network %s (site_id: %s) not found in InfoBlox", cidr, site_id)
                     results['missing'].append({
                         'property': prop.to_dict(),
                         'cidr': cidr,
@@ -943,7 +1051,7 @@ class PropertyManager:
                     })
                 else:
                     # Network exists as regular network
-                    logger.debug(f"Network {cidr} (site_id: {site_id}) found in InfoBlox")
+                    logger.debug("Network %s (site_id: %s) found in InfoBlox", cidr, site_id)
                     ib_network = existence_check['object']
                     ib_eas = {k: v.get('value', '') for k, v in ib_network.get('extattrs', {}).items()}
                     
@@ -951,7 +1059,7 @@ class PropertyManager:
                     ea_match = self._compare_eas(mapped_eas, ib_eas)
                     
                     if ea_match:
-                        logger.debug(f"Network {cidr} (site_id: {site_id}) has matching EAs")
+                        logger.debug("Network %s (site_id: %s) has matching EAs", cidr, site_id)
                         results['matches'].append({
                             'property': prop.to_dict(),
                             'cidr': cidr,
@@ -994,7 +1102,10 @@ class PropertyManager:
                         'cidr': cidr,
                         'error': error_msg
                     })
-        
+
+        if duplicate_count:
+            logger.info(f"Reused cached InfoBlox lookups for {duplicate_count} duplicate CIDR entries")
+
         return results
     
     def _compare_eas(self, mapped_eas: Dict[str, str], ib_eas: Dict[str, str]) -> bool:
@@ -1060,129 +1171,172 @@ class PropertyManager:
                 'existing_count': existing_count
             }
     
-    def create_missing_networks(self, missing_networks: List[Dict], network_view: str = "default", 
+    # Networks per bulk WAPI request - keeps payloads within grid limits
+    BULK_CREATE_CHUNK_SIZE = 500
+
+    def create_missing_networks(self, missing_networks: List[Dict], network_view: str = "default",
                                dry_run: bool = False) -> List[Dict]:
         """Create missing networks in InfoBlox"""
         results = []
-        
-        for item in missing_networks:
-            prop = item['property']
-            cidr = item['cidr']
-            mapped_eas = item['mapped_eas']
-            site_id = item['site_id']
-            m_host = item['m_host']
-            
-            try:
-                if dry_run:
-                    logger.info(f"[DRY RUN] Would create network: {cidr} (site_id: {site_id})")
-                    results.append({
-                        'cidr': cidr,
-                        'site_id': site_id,
-                        'm_host': m_host,
-                        'action': 'would_create',
-                        'result': 'success'
-                    })
-                else:
-                    # Create the network
-                    comment = f"Property Network: {m_host} (Site ID: {site_id})"
-                    result = self.ib_client.create_network(
-                        cidr=cidr,
-                        network_view=network_view,
-                        comment=comment,
-                        extattrs=mapped_eas
+
+        if dry_run:
+            for item in missing_networks:
+                logger.info(f"[DRY RUN] Would create network: {item['cidr']} (site_id: {item['site_id']})")
+                results.append({
+                    'cidr': item['cidr'],
+                    'site_id': item['site_id'],
+                    'm_host': item['m_host'],
+                    'action': 'would_create',
+                    'result': 'success'
+                })
+            return results
+
+        # Batch creates through the WAPI request endpoint: one HTTPS round
+        # trip per chunk instead of one per network. The grid executes a
+        # chunk atomically, so a failed chunk falls back to per-network
+        # creation to keep partial progress and detailed error reporting.
+        for start in range(0, len(missing_networks), self.BULK_CREATE_CHUNK_SIZE):
+            chunk = missing_networks[start:start + self.BULK_CREATE_CHUNK_SIZE]
+
+            ops = []
+            for item in chunk:
+                comment = f"Property Network: {item['m_host']} (Site ID: {item['site_id']})"
+                ops.append({
+                    'method': 'POST',
+                    'object': 'network',
+                    'data': self.ib_client._network_payload(
+                        item['cidr'], network_view, comment, item['mapped_eas']
                     )
-                    
-                    logger.info(f"Created network: {cidr} (site_id: {site_id})")
-                    results.append({
-                        'cidr': cidr,
-                        'site_id': site_id,
-                        'm_host': m_host,
-                        'action': 'created',
-                        'result': 'success',
-                        'ref': result
-                    })
-                    
+                })
+
+            try:
+                refs = self.ib_client.bulk_request(ops)
             except Exception as e:
-                error_msg = str(e)
-                error_lower = error_msg.lower()
-                
-                # Check if network already exists (not really an error)
-                if 'already exists' in error_lower or 'duplicate' in error_lower:
-                    logger.info(f"Network {cidr} already exists - checking if EAs need updating")
-                    
-                    # Try to get the existing network and update its EAs
-                    try:
-                        existing_network = self.ib_client.get_network_by_cidr(cidr, network_view)
-                        if existing_network:
-                            # Update the EAs on the existing network
-                            network_ref = existing_network['_ref']
-                            self.ib_client.update_network_extattrs(network_ref, mapped_eas)
-                            logger.info(f"Updated EAs for existing network: {cidr}")
-                            
-                            results.append({
-                                'cidr': cidr,
-                                'site_id': site_id,
-                                'm_host': m_host,
-                                'action': 'already_existed_updated_eas',
-                                'result': 'success'
-                            })
-                        else:
-                            results.append({
-                                'cidr': cidr,
-                                'site_id': site_id,
-                                'm_host': m_host,
-                                'action': 'already_existed',
-                                'result': 'success'
-                            })
-                    except Exception as update_error:
-                        logger.warning(f"Could not update EAs for existing network {cidr}: {update_error}")
-                        results.append({
+                logger.warning(f"Bulk create of {len(chunk)} networks failed ({e}); "
+                               f"falling back to per-network creation")
+                for item in chunk:
+                    results.append(self._create_single_network(item, network_view))
+                continue
+
+            for item, ref in zip(chunk, refs):
+                logger.info(f"Created network: {item['cidr']} (site_id: {item['site_id']})")
+                results.append({
+                    'cidr': item['cidr'],
+                    'site_id': item['site_id'],
+                    'm_host': item['m_host'],
+                    'action': 'created',
+                    'result': 'success',
+                    'ref': ref
+                })
+
+        # Generate status CSV files
+        self._generate_creation_status_csv(results)
+
+        return results
+
+    def _create_single_network(self, item: Dict, network_view: str) -> Dict:
+        """Create one network, classifying failures (bulk-create fallback path)"""
+        prop = item['property']
+        cidr = item['cidr']
+        mapped_eas = item['mapped_eas']
+        site_id = item['site_id']
+        m_host = item['m_host']
+
+        try:
+            # Create the network
+            comment = f"Property Network: {m_host} (Site ID: {site_id})"
+            result = self.ib_client.create_network(
+                cidr=cidr,
+                network_view=network_view,
+                comment=comment,
+                extattrs=mapped_eas
+            )
+
+            logger.info(f"Created network: {cidr} (site_id: {site_id})")
+            return {
+                'cidr': cidr,
+                'site_id': site_id,
+                'm_host': m_host,
+                'action': 'created',
+                'result': 'success',
+                'ref': result
+            }
+
+        except Exception as e:
+            error_msg = str(e)
+            error_lower = error_msg.lower()
+
+            # Check if network already exists (not really an error)
+            if 'already exists' in error_lower or 'duplicate' in error_lower:
+                logger.info(f"Network {cidr} already exists - checking if EAs need updating")
+
+                # Try to get the existing network and update its EAs
+                try:
+                    existing_network = self.ib_client.get_network_by_cidr(cidr, network_view)
+                    if existing_network:
+                        # Update the EAs on the existing network
+                        network_ref = existing_network['_ref']
+                        self.ib_client.update_network_extattrs(network_ref, mapped_eas)
+                        logger.info(f"Updated EAs for existing network: {cidr}")
+
+                        return {
                             'cidr': cidr,
                             'site_id': site_id,
                             'm_host': m_host,
-                            'action': 'already_existed_ea_update_failed',
-                            'error': str(update_error),
-                            'property': prop
-                        })
-                else:
-                    # This is a real error
-                    logger.error(f"Failed to create network {cidr}: {error_msg}")
-                    
-                    # Categorize the error
-                    category = 'unknown'
-                    if 'overlap' in error_lower or 'parent' in error_lower:
-                        category = 'overlap'
-                    elif 'permission' in error_lower or 'auth' in error_lower:
-                        category = 'permission'
-                    elif 'invalid' in error_lower:
-                        category = 'invalid'
-                    elif 'network view' in error_lower:
-                        category = 'network_view_error'
-                    elif 'not found' in error_lower:
-                        category = 'not_found'
-                    elif 'extensible' in error_lower or 'attribute' in error_lower:
-                        category = 'ea_error'
-                    
-                    # Log detailed debugging info
-                    logger.debug(f"Network creation failed - Category: {category}")
-                    logger.debug(f"Property Details: Site ID={site_id}, Host={m_host}, CIDR={cidr}")
-                    logger.debug(f"Extended Attributes: {mapped_eas}")
-                    
-                    results.append({
+                            'action': 'already_existed_updated_eas',
+                            'result': 'success'
+                        }
+                    else:
+                        return {
+                            'cidr': cidr,
+                            'site_id': site_id,
+                            'm_host': m_host,
+                            'action': 'already_existed',
+                            'result': 'success'
+                        }
+                except Exception as update_error:
+                    logger.warning(f"Could not update EAs for existing network {cidr}: {update_error}")
+                    return {
                         'cidr': cidr,
                         'site_id': site_id,
                         'm_host': m_host,
-                        'action': 'error',
-                        'error': error_msg,
-                        'category': category,
+                        'action': 'already_existed_ea_update_failed',
+                        'error': str(update_error),
                         'property': prop
-                    })
-        
-        # Generate status CSV files
-        if not dry_run:
-            self._generate_creation_status_csv(results)
-        
-        return results
+                    }
+            else:
+                # This is a real error
+                logger.error(f"Failed to create network {cidr}: {error_msg}")
+
+                # Categorize the error
+                category = 'unknown'
+                if 'overlap' in error_lower or 'parent' in error_lower:
+                    category = 'overlap'
+                elif 'permission' in error_lower or 'auth' in error_lower:
+                    category = 'permission'
+                elif 'invalid' in error_lower:
+                    category = 'invalid'
+                elif 'network view' in error_lower:
+                    category = 'network_view_error'
+                elif 'not found' in error_lower:
+                    category = 'not_found'
+                elif 'extensible' in error_lower or 'attribute' in error_lower:
+                    category = 'ea_error'
+
+                # Log detailed debugging info
+                logger.debug("Network creation failed - Category: %s", category)
+                logger.debug("Property Details: Site ID=%s, Host=%s, CIDR=%s", site_id, m_host, cidr)
+                logger.debug("Extended Attributes: %s", mapped_eas)
+
+                return {
+                    'cidr': cidr,
+                    'site_id': site_id,
+                    'm_host': m_host,
+                    'action': 'error',
+                    'error': error_msg,
+                    'category': category,
+                    'property': prop
+                }
     
     def _generate_network_creation_errors_csv(self, error_results: List[Dict]):
         """Generate CSV file with actual network creation errors"""